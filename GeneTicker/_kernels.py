@@ -0,0 +1,223 @@
+"""
+Codon counting kernels used by the core analysis.
+
+Codons are packed into 6-bit integers (A=0, C=1, G=2, T=3, first base in the
+high bits) and counted into a dense accumulator indexed by
+``(codon, amino acid, special type)``. When Numba is installed the kernel is
+compiled to machine code, otherwise an equivalent NumPy implementation is used.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:
+    njit = None
+
+# Lookup table mapping ASCII bytes to 2-bit base codes. Any byte that is not a valid base maps
+# to _INVALID_BASE, so validation is a range check on the codes. Both cases are mapped so
+# sequences never need to be uppercased first.
+_INVALID_BASE = 4
+_BASE_LUT = np.full(256, _INVALID_BASE, dtype=np.uint8)
+for _bases in ("ACGT", "acgt"):
+    _BASE_LUT[[ord(base) for base in _bases]] = np.arange(4, dtype=np.uint8)
+
+# Lookup table mapping ASCII bases to their complement, leaving any other byte unchanged
+_COMPLEMENT_LUT = np.arange(256, dtype=np.uint8)
+for _bases, _complement in (("ACGT", "TGCA"), ("acgt", "tgca")):
+    _COMPLEMENT_LUT[[ord(base) for base in _bases]] = [ord(base) for base in _complement]
+
+# All 64 codons, indexed by their packed 6-bit code
+CODONS = np.array([a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT"])
+
+# Labels of the special type axis of the accumulator
+SPECIAL_TYPES = np.array(["", "START", "STOP"])
+
+# Amino acids, indexed by their position on the amino acid axis of the accumulator.
+# The stop symbol '*' maps to 0 and letters to 1-26, so indices sort like the symbols themselves
+# and the non-zero entries of the accumulator come out in (codon, amino acid, special type) order.
+AMINO_ACIDS = np.array(["*"] + [chr(ord("A") + i) for i in range(26)] + [""] * 5)
+_STOP_AA = 0
+
+# Strides of the codon and amino acid axes in the flattened accumulator
+_AA_STRIDE = len(SPECIAL_TYPES)
+_CODON_STRIDE = len(AMINO_ACIDS) * _AA_STRIDE
+
+# Lookup table mapping ASCII amino acid codes to their index; anything other than a letter maps to '*'
+_AA_LUT = np.full(256, _STOP_AA, dtype=np.uint8)
+_AA_LUT[ord("A") : ord("Z") + 1] = np.arange(1, 27, dtype=np.uint8)
+
+
+def new_counts() -> np.ndarray:
+    """
+    Allocates an empty accumulator for :func:`count_codons`.
+
+    :return: Zeroed array of shape (64, len(AMINO_ACIDS), len(SPECIAL_TYPES))
+    :rtype: np.ndarray
+    """
+    return np.zeros((64, len(AMINO_ACIDS), len(SPECIAL_TYPES)), dtype=np.int64)
+
+
+def reverse_complement(bases: np.ndarray) -> np.ndarray:
+    """
+    Reverse complements a sequence of ASCII bases.
+
+    :param bases: ASCII bytes of the sequence
+    :type bases: np.ndarray
+    :return: ASCII bytes of the reverse complement
+    :rtype: np.ndarray
+    """
+    return _COMPLEMENT_LUT[bases[::-1]]
+
+
+def _count_codons_numpy(bases: np.ndarray, translation: np.ndarray, counts: np.ndarray) -> bool:
+    """
+    NumPy implementation of :func:`count_codons`.
+    """
+    # Map the bases to codes and validate them in a single lookup
+    codes = _BASE_LUT[bases]
+    if codes.max(initial=0) >= _INVALID_BASE:
+        return False
+
+    n_codons = len(codes) // 3
+    if n_codons == 0:
+        return True
+
+    codes = codes[: n_codons * 3].reshape(n_codons, 3)
+    packed = codes[:, 0] * 16 + codes[:, 1] * 4 + codes[:, 2]
+
+    n_coded = min(n_codons, len(translation))
+    amino_acids = _AA_LUT[translation[:n_coded]]
+    if n_coded:
+        counts[packed[0], amino_acids[0], 1] += 1
+    # Encode each (codon, amino acid) pair as a single integer key into the flattened accumulator,
+    # so the body codons are counted with one 1-D scatter instead of a 3-D fancy index
+    keys = packed[1:n_coded].astype(np.intp) * _CODON_STRIDE + amino_acids[1:] * _AA_STRIDE
+    np.add.at(counts.reshape(-1), keys, 1)
+    counts[:, _STOP_AA, 2] += np.bincount(packed[n_coded:], minlength=64)
+    return True
+
+
+def _count_codons_loop(bases, translation, counts):
+    """
+    Single pass loop implementation of :func:`count_codons`, compiled with Numba.
+    """
+    n_bases = bases.shape[0]
+    for i in range(n_bases):
+        if _BASE_LUT[bases[i]] >= _INVALID_BASE:
+            return False
+
+    n_translated = translation.shape[0]
+    for i in range(0, n_bases - 2, 3):
+        codon = (_BASE_LUT[bases[i]] << 4) | (_BASE_LUT[bases[i + 1]] << 2) | _BASE_LUT[bases[i + 2]]
+        aa_index = i // 3
+        if aa_index < n_translated:
+            counts[codon, _AA_LUT[translation[aa_index]], 1 if aa_index == 0 else 0] += 1
+        else:
+            counts[codon, _STOP_AA, 2] += 1
+    return True
+
+
+def _count_codons_batch_numpy(bases, base_offsets, translations, translation_offsets, counts, valid, n_chunks):
+    """
+    Sequential NumPy implementation of the batch kernel used by :func:`count_codons_batch`.
+    """
+    for k in range(len(valid)):
+        valid[k] = _count_codons_numpy(
+            bases[base_offsets[k] : base_offsets[k + 1]],
+            translations[translation_offsets[k] : translation_offsets[k + 1]],
+            counts,
+        )
+
+
+def _count_codons_batch_loop(bases, base_offsets, translations, translation_offsets, counts, valid, n_chunks):
+    """
+    Parallel implementation of the batch kernel used by :func:`count_codons_batch`, compiled with Numba.
+
+    The CDS are split into ``n_chunks`` strided chunks, typically one per thread, each
+    counted into a private accumulator that is reduced into ``counts`` at the end.
+    """
+    n_cds = valid.shape[0]
+    local_counts = np.zeros((n_chunks,) + counts.shape, dtype=np.int64)
+
+    for chunk in prange(n_chunks):
+        for k in range(chunk, n_cds, n_chunks):
+            valid[k] = _count_codons(
+                bases[base_offsets[k] : base_offsets[k + 1]],
+                translations[translation_offsets[k] : translation_offsets[k + 1]],
+                local_counts[chunk],
+            )
+
+    for chunk in range(n_chunks):
+        counts += local_counts[chunk]
+
+
+if njit is not None:
+    _count_codons = njit(cache=True, boundscheck=False, nogil=True)(_count_codons_loop)
+    _count_codons_batch = njit(cache=True, boundscheck=False, nogil=True, parallel=True)(_count_codons_batch_loop)
+else:
+    _count_codons = _count_codons_numpy
+    _count_codons_batch = _count_codons_batch_numpy
+
+
+def _concatenate(arrays: Sequence[np.ndarray]):
+    """
+    Concatenates byte arrays into one buffer along with the offsets delimiting each of them.
+    """
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum([len(array) for array in arrays], out=offsets[1:])
+    return np.concatenate(arrays), offsets
+
+
+def count_codons(bases: np.ndarray, translation: np.ndarray, counts: np.ndarray) -> bool:
+    """
+    Counts the codons of a single CDS into the accumulator.
+
+    Codons covered by the translation are mapped to its amino acids, with the first
+    codon tracked as 'START'. Any codons past the end of the translation are counted
+    as 'STOP' with amino acid '*'. Trailing bases that do not form a full codon are
+    ignored. Nothing is counted if the CDS contains bytes other than A, C, G or T
+    (in either case).
+
+    :param bases: ASCII bytes of the CDS
+    :type bases: np.ndarray
+    :param translation: ASCII bytes of the /translation qualifier
+    :type translation: np.ndarray
+    :param counts: Accumulator created by :func:`new_counts`
+    :type counts: np.ndarray
+    :return: True if the CDS was counted, False if it contains invalid bases
+    :rtype: bool
+    """
+    return _count_codons(bases, translation, counts)
+
+
+def count_codons_batch(
+    bases: Sequence[np.ndarray], translations: Sequence[np.ndarray], counts: np.ndarray
+) -> np.ndarray:
+    """
+    Counts the codons of a batch of CDS into the accumulator.
+
+    Equivalent to calling :func:`count_codons` for every CDS, but the whole batch is
+    handed to the kernel at once. When Numba is installed the CDS are counted in
+    parallel across threads.
+
+    :param bases: ASCII bytes of each CDS
+    :type bases: Sequence[np.ndarray]
+    :param translations: ASCII bytes of the /translation qualifier of each CDS
+    :type translations: Sequence[np.ndarray]
+    :param counts: Accumulator created by :func:`new_counts`
+    :type counts: np.ndarray
+    :return: Boolean array flagging which CDS were counted (False if they contain invalid bases)
+    :rtype: np.ndarray
+    """
+    valid = np.zeros(len(bases), dtype=bool)
+    if len(bases) == 0:
+        return valid
+
+    n_chunks = min(get_num_threads(), len(bases)) if njit is not None else 1
+    base_buffer, base_offsets = _concatenate(bases)
+    translation_buffer, translation_offsets = _concatenate(translations)
+    _count_codons_batch(base_buffer, base_offsets, translation_buffer, translation_offsets, counts, valid, n_chunks)
+    return valid
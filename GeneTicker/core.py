@@ -8,27 +8,121 @@ extracts the DNA sequence for each CDS, and counts the occurrences of
 each 64-possible codon, mapping them to their corresponding amino acid.
 """
 
-from collections import Counter
+import io
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-from Bio import SeqIO
-from Bio.Seq import Seq
-from Bio.SeqFeature import SeqFeature
+from Bio.GenBank.Scanner import GenBankScanner
+from Bio.SeqFeature import SeqFeature, SimpleLocation
 from Bio.SeqRecord import SeqRecord
 
+from GeneTicker._kernels import AMINO_ACIDS, CODONS, SPECIAL_TYPES, count_codons_batch, new_counts, reverse_complement
 from GeneTicker.utils import export_results_to_file, print_results
 
-# Define a type alias for our codon counter for clarity
-CodonAACounter = Counter[Tuple[str, str, str]]
-
-# Define the set of valid, unambiguous DNA bases
-VALID_BASES = set("ATCG")
-
 # Default minimum frequency to include a codon in the final report
 DEFAULT_MIN_FREQ = 0.05
 
+# Read buffer size for GenBank files
+READ_BUFFER_SIZE = 1 << 20
+
+# Maximum number of CDS handed to the counting kernel at once
+CDS_BATCH_SIZE = 1000
+
+# Feature qualifiers needed to count the codons of a CDS
+CDS_QUALIFIERS = frozenset(("locus_tag", "translation", "pseudo"))
+
+
+class _CDSScanner(GenBankScanner):
+    """
+    GenBank scanner that only passes CDS features, with the qualifiers in CDS_QUALIFIERS, on
+    to the consumer. Other features are skipped before their locations and qualifiers are parsed
+    into SeqFeature objects.
+    """
+
+    @staticmethod
+    def _feed_feature_table(consumer, feature_tuples):
+        consumer.start_feature_table()
+        for feature_key, location_string, qualifiers in feature_tuples:
+            if feature_key != "CDS":
+                continue
+
+            consumer.feature_key(feature_key)
+            consumer.location(location_string)
+            for q_key, q_value in qualifiers:
+                if q_key not in CDS_QUALIFIERS:
+                    continue
+                consumer.feature_qualifier(q_key, q_value if q_value is None else q_value.replace("\n", " "))
+
+
+def _open_genbank(gbff_file: Path) -> io.TextIOWrapper:
+    """
+    Opens a GenBank file for parsing, reading it through a READ_BUFFER_SIZE buffer to cut down
+    on read calls. Newlines are not translated, as the scanner strips line endings itself.
+
+    :param gbff_file: The file path to the GenBank file
+    :type gbff_file: Path
+    :return: Text handle of the file
+    :rtype: io.TextIOWrapper
+    """
+    return io.TextIOWrapper(open(gbff_file, "rb", buffering=READ_BUFFER_SIZE), encoding="utf-8", newline="")
+
+
+def _count_pending_cds(
+    pending: List[Tuple[str, np.ndarray, np.ndarray]],
+    skipped: List[Tuple[int, str]],
+    counts: np.ndarray,
+    verbose: bool,
+) -> None:
+    """
+    Counts a batch of extracted CDS into the accumulator and empties the batch.
+
+    Warnings for CDS skipped before extraction are held in ``skipped`` until the batch
+    is counted, so that with verbose output all warnings are printed in CDS order.
+
+    :param pending: (locus tag, CDS bytes, translation bytes) of each CDS in the batch
+    :type pending: List[Tuple[str, np.ndarray, np.ndarray]]
+    :param skipped: (position in the batch, warning) of each CDS skipped before extraction
+    :type skipped: List[Tuple[int, str]]
+    :param counts: Accumulator to add the codon counts to
+    :type counts: np.ndarray
+    :param verbose: If True, reports CDS that were skipped or truncated
+    :type verbose: bool
+    """
+    valid = ()
+    if pending:
+        locus_tags, bases, translations = zip(*pending)
+        valid = count_codons_batch(bases, translations, counts)
+
+    if verbose:
+        messages = iter(skipped)
+        message = next(messages, None)
+        for k, cds_valid in enumerate(valid):
+            # Print the warnings of CDS skipped before this one
+            while message is not None and message[0] <= k:
+                print(message[1])
+                message = next(messages, None)
+
+            cds_len = len(bases[k])
+            truncated_len = (cds_len // 3) * 3
+
+            if not cds_valid:
+                print(f"  > Warning: CDS {locus_tags[k]} (length {cds_len}) contains non-ATCG bases. Skipping.")
+            elif cds_len != truncated_len:
+                print(
+                    f"  > Warning: CDS {locus_tags[k]} "
+                    f"(length {cds_len}) is not a multiple of 3. "
+                    f"Truncating to {truncated_len} bases for counting."
+                )
+
+        while message is not None:
+            print(message[1])
+            message = next(messages, None)
+
+    pending.clear()
+    skipped.clear()
+
 
 def calculate_codon_frequency_to_df(
     gbff_file: Path, min_freq_threshold: float, verbose: bool = False
@@ -51,76 +145,68 @@ def calculate_codon_frequency_to_df(
     if verbose:
         print(f"--- Starting analysis of {gbff_file.name} ---")
 
-    codon_aa_counts: CodonAACounter = Counter()
+    counts = new_counts()
+    pending: List[Tuple[str, np.ndarray, np.ndarray]] = []
+    skipped: List[Tuple[int, str]] = []
     total_cds_processed = 0
 
     try:
-        for record in SeqIO.parse(gbff_file, "genbank"):
-            record: SeqRecord
-            if verbose:
-                print(f"Processing record: {record.id}")
-
-            for feature in record.features:
-                feature: SeqFeature
-
-                if feature.type == "CDS":
-                    locus_tag = feature.qualifiers.get("locus_tag", ["?"])[0]
-                    translation_str = feature.qualifiers.get("translation", [""])[0]
-
-                    if not translation_str:
-                        if verbose:
-                            print(f"  > Warning: CDS {locus_tag} is missing /translation qualifier. Skipping.")
-                        continue
-
-                    if "pseudo" in feature.qualifiers:
-                        if verbose:
-                            print(f"  > Skipping pseudogene: {locus_tag}")
-                        continue
-
-                    total_cds_processed += 1
-
-                    cds_seq: Seq = feature.extract(record.seq)
-
-                    cds_seq_str = str(cds_seq).upper()
-                    if not set(cds_seq_str).issubset(VALID_BASES):
-                        if verbose:
-                            print(
-                                f"  > Warning: CDS {locus_tag} (length {len(cds_seq)}) "
-                                "contains non-ATCG bases. Skipping."
-                            )
-                        continue
-
-                    cds_len = len(cds_seq)
-                    truncated_len = (cds_len // 3) * 3
-
-                    if cds_len != truncated_len and verbose:
-                        print(
-                            f"  > Warning: CDS {locus_tag} "
-                            f"(length {cds_len}) is not a multiple of 3. "
-                            f"Truncating to {truncated_len} bases for counting."
-                        )
-
-                    # Iterate over the sequence in 3-base-pair steps (codons)
-                    for i in range(0, truncated_len, 3):
-                        codon = cds_seq_str[i : i + 3]
-                        aa_index = i // 3
-
-                        aa_code: str
-                        special_type: str = ""
-
-                        # Use the translation string for the AA code for all non-stop codons.
-                        if aa_index < len(translation_str):
-                            aa_code = translation_str[aa_index]
-
-                            if i == 0:
-                                special_type = "START"
+        with _open_genbank(gbff_file) as handle:
+            for record in _CDSScanner(debug=0).parse_records(handle):
+                record: SeqRecord
+                if verbose:
+                    print(f"Processing record: {record.id}")
+
+                # Bind per-record lookups once, outside the feature loop
+                record_seq = record.seq
+                append_pending = pending.append
+
+                # Bytes of the whole record, only read once a CDS can be sliced from them
+                record_bases: Optional[np.ndarray] = None
+
+                for feature in record.features:
+                    feature: SeqFeature
+
+                    if feature.type == "CDS":
+                        qualifiers = feature.qualifiers
+                        locus_tag = qualifiers.get("locus_tag", ["?"])[0]
+                        translation_str = qualifiers.get("translation", [""])[0]
+
+                        if not translation_str:
+                            if verbose:
+                                skipped.append(
+                                    (
+                                        len(pending),
+                                        f"  > Warning: CDS {locus_tag} is missing /translation qualifier. Skipping.",
+                                    )
+                                )
+                            continue
+
+                        if "pseudo" in qualifiers:
+                            if verbose:
+                                skipped.append((len(pending), f"  > Skipping pseudogene: {locus_tag}"))
+                            continue
+
+                        total_cds_processed += 1
+
+                        location = feature.location
+                        if isinstance(location, SimpleLocation) and location.ref is None:
+                            # Slice simple locations directly from the record bytes
+                            if record_bases is None:
+                                record_bases = np.frombuffer(bytes(record_seq), dtype=np.uint8)
+                            bases = record_bases[int(location.start) : int(location.end)]
+                            if location.strand == -1:
+                                bases = reverse_complement(bases)
                         else:
-                            # Handle STOP codon
-                            aa_code = "*"
-                            special_type = "STOP"
+                            bases = np.frombuffer(bytes(feature.extract(record_seq)), dtype=np.uint8)
+
+                        translation = np.frombuffer(translation_str.encode("ascii"), dtype=np.uint8)
+                        append_pending((locus_tag, bases, translation))
 
-                        # Use a tuple as the key to avoid string parsing later
-                        codon_aa_counts[(codon, aa_code, special_type)] += 1
+                        if len(pending) >= CDS_BATCH_SIZE:
+                            _count_pending_cds(pending, skipped, counts, verbose)
+
+                _count_pending_cds(pending, skipped, counts, verbose)
 
     except FileNotFoundError:
         print(f"Error: File not found at {gbff_file}")
@@ -132,37 +218,36 @@ def calculate_codon_frequency_to_df(
     if verbose:
         print(f"--- Analysis complete. Processed {total_cds_processed} CDS features. ---")
 
-    total_codons = sum(codon_aa_counts.values())
+    total_codons = int(counts.sum())
     if total_codons == 0:
         return None
 
-    data: List[dict] = []
-    # Unpack the tuple key
-    for (codon, aa_code, special_type), count in sorted(codon_aa_counts.items()):
-        frequency_percent = (count / total_codons) * 100
-
-        data.append(
-            {
-                "Amino Acid": "*" if special_type == "STOP" or aa_code == "*" else aa_code,
-                "Codon": codon,
-                "Count": count,
-                "Freq. (%)": frequency_percent,
-                "Special Type": special_type,
-            }
-        )
-    df = pd.DataFrame(data)
-
-    if df.empty:
-        return None
-
-    df = df[["Amino Acid", "Codon", "Count", "Freq. (%)", "Special Type"]]
+    # Materialize the non-zero (codon, amino acid, special type) entries of the accumulator,
+    # which np.nonzero already returns in report order
+    codon_index, aa_index, special_index = np.nonzero(counts)
+    count_arr = counts[codon_index, aa_index, special_index]
+    # Hoist the reciprocal so the frequencies take a single multiplication per entry
+    freq_arr = count_arr * (100.0 / total_codons)
 
     if min_freq_threshold > 0.0:
         if verbose:
             print(f"Filtering out codons with frequency below {min_freq_threshold:.2f}%...")
-        df = df[df["Freq. (%)"] >= min_freq_threshold].reset_index(drop=True)
+        # Filter the column arrays so the DataFrame is only built for the rows that are kept
+        mask = freq_arr >= min_freq_threshold
+        codon_index, aa_index, special_index = codon_index[mask], aa_index[mask], special_index[mask]
+        count_arr, freq_arr = count_arr[mask], freq_arr[mask]
         if verbose:
-            print(f"Remaining codons after filtering: {len(df)}")
+            print(f"Remaining codons after filtering: {len(count_arr)}")
+
+    df = pd.DataFrame(
+        {
+            "Amino Acid": AMINO_ACIDS[aa_index],
+            "Codon": CODONS[codon_index],
+            "Count": count_arr,
+            "Freq. (%)": freq_arr,
+            "Special Type": SPECIAL_TYPES[special_index],
+        }
+    )
 
     return df
 
@@ -1,8 +1,69 @@
+import sys
 from pathlib import Path
 
 import pandas as pd
 
 
+# Arrow types of the report columns, so exports keep the same schema even when they are empty
+_ARROW_TYPES = {
+    "Amino Acid": "string",
+    "Codon": "string",
+    "Count": "int64",
+    "Freq. (%)": "float64",
+    "Special Type": "string",
+}
+
+
+def _arrow_table(df: pd.DataFrame):
+    """
+    Builds a pyarrow Table directly from the raw column arrays of a DataFrame,
+    without the pandas index and metadata. Report columns get their explicit Arrow
+    type from _ARROW_TYPES; the type of any other column is inferred from its values.
+
+    :param df: Dataframe to convert
+    :type df: pd.DataFrame
+    :return: Table with the same columns as the DataFrame
+    :rtype: pyarrow.Table
+    """
+    import pyarrow as pa
+
+    columns = {}
+    for column in df.columns:
+        arrow_type = _ARROW_TYPES.get(column)
+        columns[column] = pa.array(
+            df[column].to_numpy(), type=None if arrow_type is None else pa.type_for_alias(arrow_type)
+        )
+    return pa.Table.from_pydict(columns)
+
+
+def _write_arrow(df: pd.DataFrame, output_path: Path, ext: str):
+    """
+    Writes a DataFrame to a feather, parquet (zstd compressed) or orc file with pyarrow.
+    Raises ImportError if pyarrow, or its writer for the format, is not available.
+
+    :param df: Dataframe to export
+    :type df: pd.DataFrame
+    :param output_path: Output file path
+    :type output_path: Path
+    :param ext: Lowercase file extension; one of .feather, .parquet or .orc
+    :type ext: str
+    """
+    table = _arrow_table(df)
+
+    if ext == ".feather":
+        from pyarrow import feather
+
+        feather.write_feather(table, output_path)
+    elif ext == ".parquet":
+        from pyarrow import parquet
+
+        parquet.write_table(table, output_path, compression="zstd")
+    elif ext == ".orc":
+        from pyarrow import orc
+
+        orc.write_table(table, output_path)
+
+
 def export_results_to_file(df: pd.DataFrame, output_path: Path, verbose: bool = False) -> bool:
     """
     Writes a Pandas DataFrame to a file, inferring the format from the extension.
@@ -38,12 +99,16 @@ def export_results_to_file(df: pd.DataFrame, output_path: Path, verbose: bool =
             df.to_xml(output_path, index=False)
         elif ext in (".feather", ".parquet", ".orc"):
             # Requires pyarrow or fastparquet engine
-            if ext == ".feather":
-                df.to_feather(output_path)
-            elif ext == ".parquet":
-                df.to_parquet(output_path)
-            elif ext == ".orc":
-                df.to_orc(output_path)
+            try:
+                _write_arrow(df, output_path, ext)
+            except ImportError:
+                # Without pyarrow, let pandas try any other available engine
+                if ext == ".feather":
+                    df.to_feather(output_path)
+                elif ext == ".parquet":
+                    df.to_parquet(output_path)
+                elif ext == ".orc":
+                    df.to_orc(output_path)
         else:
             # Handle unsupported extension: print error and return False
             print(
@@ -79,13 +144,17 @@ def print_results(df: pd.DataFrame, input_file_name: str):
     print(f"{'AA':<4} {'Codon':<6} {'Count':<10} {'Freq. (%)':>10} {'Special Type':<12}")
     print("-" * 49)
 
-    # Iterate over the DataFrame rows to print
-    for index, row in df.iterrows():
-        print(
-            f"{row['Amino Acid']:<4} "
-            f"{row['Codon']:<6} "
-            f"{row['Count']:<10} "
-            f"{row['Freq. (%)']:>10.4f} "
-            f"{row['Special Type']:<12}"
-        )
+    # Format the rows from the raw column arrays and write them in one call
+    rows = zip(
+        df["Amino Acid"].to_numpy(),
+        df["Codon"].to_numpy(),
+        df["Count"].to_numpy(),
+        df["Freq. (%)"].to_numpy(),
+        df["Special Type"].to_numpy(),
+    )
+    lines = [
+        f"{aa_code:<4} {codon:<6} {count:<10} {frequency:>10.4f} {special_type:<12}\n"
+        for aa_code, codon, count, frequency, special_type in rows
+    ]
+    sys.stdout.write("".join(lines))
     print("=" * 49)
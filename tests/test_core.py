@@ -9,7 +9,7 @@ import textwrap
 from GeneTicker.core import calculate_codon_frequency_to_df, run_codon_analysis
 
 
-def _write_simple_gbff(path: P):
+def _write_simple_gbff(path: P, sequence: str = "atggctggt", translation: str = "MGG", location: str = "1..{length}"):
     """Write a minimal GenBank (GBFF) file with a single CDS feature.
 
     The sequence contains three codons: ATG GCT GGT which translate to M G G
@@ -17,7 +17,7 @@ def _write_simple_gbff(path: P):
     """
     content = textwrap.dedent(
         """
-        LOCUS       TEST01                9 bp    DNA     linear   01-JAN-1980
+        LOCUS       TEST01                {length} bp    DNA     linear   01-JAN-1980
         DEFINITION  .
         ACCESSION   TEST
         VERSION     TEST.1
@@ -25,13 +25,18 @@ def _write_simple_gbff(path: P):
         SOURCE      .
           ORGANISM  .
         FEATURES             Location/Qualifiers
-             CDS             1..9
+             CDS             {location}
                              /locus_tag="TEST1"
-                             /translation="MGG"
+                             /translation="{translation}"
         ORIGIN
-                1 atggctggt
+                1 {sequence}
         //
         """
+    ).format(
+        length=len(sequence),
+        sequence=sequence,
+        translation=translation,
+        location=location.format(length=len(sequence)),
     )
     path.write_text(content)
 
@@ -52,6 +57,115 @@ def test_calculate_codon_frequency_basic(tmp_path: Path):
     assert counts.get('GGT') == 1
 
 
+def test_calculate_codon_frequency_start_and_stop(tmp_path: Path):
+    gbff = tmp_path / "stop.gbff"
+    # ATG GCT GCT TAA: the first codon is the START, the codon past the translation is the STOP
+    _write_simple_gbff(gbff, sequence="atggctgcttaa", translation="MAA")
+
+    df = calculate_codon_frequency_to_df(gbff, 0.0, verbose=False)
+    assert df is not None
+
+    rows = list(zip(df["Amino Acid"], df["Codon"], df["Count"], df["Special Type"]))
+    assert rows == [
+        ("M", "ATG", 1, "START"),
+        ("A", "GCT", 2, ""),
+        ("*", "TAA", 1, "STOP"),
+    ]
+
+
+def test_calculate_codon_frequency_row_order(tmp_path: Path):
+    gbff = tmp_path / "order.gbff"
+    # TGA is read through as selenocysteine (U) once and ends the CDS as a STOP
+    _write_simple_gbff(gbff, sequence="atgtgatga", translation="MU")
+
+    df = calculate_codon_frequency_to_df(gbff, 0.0, verbose=False)
+    assert df is not None
+
+    rows = list(zip(df["Codon"], df["Amino Acid"], df["Special Type"]))
+    assert rows == [
+        ("ATG", "M", "START"),
+        ("TGA", "*", "STOP"),
+        ("TGA", "U", ""),
+    ]
+
+
+def test_calculate_codon_frequency_complement_strand(tmp_path: Path):
+    gbff = tmp_path / "complement.gbff"
+    # Reverse complement of ATG GCT GCT TAA
+    _write_simple_gbff(gbff, sequence="ttaagcagccat", translation="MAA", location="complement(1..{length})")
+
+    df = calculate_codon_frequency_to_df(gbff, 0.0, verbose=False)
+    assert df is not None
+
+    rows = list(zip(df["Amino Acid"], df["Codon"], df["Count"], df["Special Type"]))
+    assert rows == [
+        ("M", "ATG", 1, "START"),
+        ("A", "GCT", 2, ""),
+        ("*", "TAA", 1, "STOP"),
+    ]
+
+
+def test_calculate_codon_frequency_compound_location(tmp_path: Path):
+    gbff = tmp_path / "join.gbff"
+    # The CDS skips the "ccc" between ATG GCT and GCT TAA
+    _write_simple_gbff(gbff, sequence="atggctcccgcttaa", translation="MAA", location="join(1..6,10..15)")
+
+    df = calculate_codon_frequency_to_df(gbff, 0.0, verbose=False)
+    assert df is not None
+    assert dict(zip(df["Codon"], df["Count"])) == {"ATG": 1, "GCT": 2, "TAA": 1}
+
+
+def test_calculate_codon_frequency_threshold_filters_rows(tmp_path: Path):
+    gbff = tmp_path / "filter.gbff"
+    _write_simple_gbff(gbff, sequence="atggctgcttaa", translation="MAA")
+
+    # GCT makes up 50% of the codons, ATG and TAA 25% each
+    df = calculate_codon_frequency_to_df(gbff, 30.0, verbose=False)
+    assert df is not None
+    assert df["Codon"].tolist() == ["GCT"]
+    assert df.index.tolist() == [0]
+    assert df["Freq. (%)"].tolist() == [50.0]
+
+
+def test_calculate_codon_frequency_verbose_warnings_in_cds_order(tmp_path: Path, capsys):
+    gbff = tmp_path / "warnings.gbff"
+    gbff.write_text(
+        textwrap.dedent(
+            """
+            LOCUS       TEST01                25 bp    DNA     linear   01-JAN-1980
+            DEFINITION  .
+            ACCESSION   TEST
+            VERSION     TEST.1
+            KEYWORDS    .
+            SOURCE      .
+              ORGANISM  .
+            FEATURES             Location/Qualifiers
+                 CDS             1..6
+                                 /locus_tag="INVALID"
+                                 /translation="MX"
+                 CDS             7..12
+                                 /locus_tag="PSEUDO"
+                                 /pseudo
+                                 /translation="MA"
+                 CDS             13..20
+                                 /locus_tag="TRUNCATED"
+                                 /translation="MA"
+                 CDS             21..25
+                                 /locus_tag="NOTRANSLATION"
+            ORIGIN
+                    1 atgnnnatgg ctatggctgg atggc
+            //
+            """
+        )
+    )
+
+    calculate_codon_frequency_to_df(gbff, 0.0, verbose=True)
+    out = capsys.readouterr().out
+
+    positions = [out.index(tag) for tag in ("INVALID", "PSEUDO", "TRUNCATED", "NOTRANSLATION")]
+    assert positions == sorted(positions)
+
+
 def test_calculate_codon_frequency_missing_file(tmp_path: Path):
     missing = tmp_path / "no_such.gbff"
     df = calculate_codon_frequency_to_df(missing, 0.0, verbose=False)
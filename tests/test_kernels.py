@@ -0,0 +1,97 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pytest
+
+from GeneTicker._kernels import (
+    AMINO_ACIDS,
+    _count_codons_batch_numpy,
+    _count_codons_loop,
+    _count_codons_numpy,
+    count_codons,
+    count_codons_batch,
+    new_counts,
+    reverse_complement,
+)
+
+
+def _as_bytes(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+
+
+def _aa_index(aa_code: str) -> int:
+    return AMINO_ACIDS.tolist().index(aa_code)
+
+
+@pytest.mark.parametrize("kernel", [_count_codons_numpy, _count_codons_loop, count_codons])
+def test_count_codons_start_body_and_stop(kernel):
+    counts = new_counts()
+    # ATG GCT GCT TAA plus two trailing bases that do not form a codon
+    assert kernel(_as_bytes("ATGGCTGCTTAAGC"), _as_bytes("MAA"), counts) is True
+
+    assert counts.sum() == 4
+    assert counts[0b001110, _aa_index("M"), 1] == 1  # ATG, START
+    assert counts[0b100111, _aa_index("A"), 0] == 2  # GCT
+    assert counts[0b110000, _aa_index("*"), 2] == 1  # TAA, STOP
+
+
+@pytest.mark.parametrize("kernel", [_count_codons_numpy, _count_codons_loop, count_codons])
+def test_count_codons_accepts_lowercase_bases(kernel):
+    upper, lower = new_counts(), new_counts()
+    assert kernel(_as_bytes("ATGGCTGCTTAA"), _as_bytes("MAA"), upper) is True
+    assert kernel(_as_bytes("atgGCTgctTAA"), _as_bytes("MAA"), lower) is True
+    np.testing.assert_array_equal(upper, lower)
+
+
+@pytest.mark.parametrize("kernel", [_count_codons_numpy, _count_codons_loop, count_codons])
+def test_count_codons_rejects_invalid_bases(kernel):
+    counts = new_counts()
+    assert kernel(_as_bytes("ATGNCTGGT"), _as_bytes("MXG"), counts) is False
+    assert counts.sum() == 0
+
+
+def test_count_codons_batch_matches_single_cds():
+    cds = [
+        ("ATGGCTGCTTAA", "MAA"),
+        ("ATGNCTGGT", "MXG"),
+        ("GTGAAAGGTTGA", "MKG"),
+        ("atgccc", "MP"),
+    ]
+    bases = [_as_bytes(seq) for seq, _ in cds]
+    translations = [_as_bytes(translation) for _, translation in cds]
+
+    expected = new_counts()
+    expected_valid = [count_codons(b, t, expected) for b, t in zip(bases, translations)]
+
+    counts = new_counts()
+    valid = count_codons_batch(bases, translations, counts)
+    assert valid.tolist() == expected_valid == [True, False, True, True]
+    np.testing.assert_array_equal(counts, expected)
+
+
+def test_count_codons_batch_numpy_fallback():
+    bases = [_as_bytes("ATGGCTGCTTAA"), _as_bytes("ATGNCTGGT")]
+    translations = [_as_bytes("MAA"), _as_bytes("MXG")]
+    base_offsets = np.array([0, 12, 21])
+    translation_offsets = np.array([0, 3, 6])
+
+    counts = new_counts()
+    valid = np.zeros(2, dtype=bool)
+    _count_codons_batch_numpy(
+        np.concatenate(bases), base_offsets, np.concatenate(translations), translation_offsets, counts, valid, 1
+    )
+    assert valid.tolist() == [True, False]
+    assert counts.sum() == 4
+
+
+def test_count_codons_batch_empty():
+    counts = new_counts()
+    assert count_codons_batch([], [], counts).size == 0
+    assert counts.sum() == 0
+
+
+def test_reverse_complement():
+    assert reverse_complement(_as_bytes("ATGcgtN")).tobytes() == b"NacgCAT"
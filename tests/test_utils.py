@@ -5,6 +5,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import pandas as pd
 import pandas.testing as pdt
+import pytest
 
 from GeneTicker.utils import export_results_to_file, print_results
 
@@ -84,11 +85,64 @@ def test_export_parquet_raises_importerror(monkeypatch, tmp_path: Path):
         raise ImportError("pyarrow is not installed")
 
     monkeypatch.setattr(pd.DataFrame, "to_parquet", _raise_importerror)
+    # Hide pyarrow so the export does not write the file with it directly
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
     ok = export_results_to_file(df, out)
     assert ok is False
     assert not out.exists()
 
 
+def _read_arrow_format(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    if path.suffix == ".feather":
+        return pd.read_feather(path)
+    return pd.read_orc(path)
+
+
+@pytest.mark.parametrize("empty", [False, True])
+@pytest.mark.parametrize("ext", [".parquet", ".feather", ".orc"])
+def test_export_arrow_formats_success(tmp_path: Path, ext: str, empty: bool):
+    pytest.importorskip("pyarrow.orc" if ext == ".orc" else "pyarrow")
+    df = _sample_df()
+    if empty:
+        df = df.iloc[:0]
+    out = tmp_path / f"out{ext}"
+
+    assert export_results_to_file(df, out) is True
+    assert out.exists()
+    read = _read_arrow_format(out)
+    pdt.assert_frame_equal(df.reset_index(drop=True), read, check_index_type=False)
+
+
+@pytest.mark.parametrize("ext", [".parquet", ".feather", ".orc"])
+def test_export_arrow_formats_empty_schema(tmp_path: Path, ext: str):
+    pa = pytest.importorskip("pyarrow")
+    if ext == ".orc":
+        pytest.importorskip("pyarrow.orc")
+
+    full, empty = tmp_path / f"full{ext}", tmp_path / f"empty{ext}"
+    assert export_results_to_file(_sample_df(), full) is True
+    assert export_results_to_file(_sample_df().iloc[:0], empty) is True
+
+    if ext == ".parquet":
+        from pyarrow import parquet
+
+        schemas = [parquet.read_schema(path) for path in (full, empty)]
+    elif ext == ".feather":
+        from pyarrow import feather
+
+        schemas = [feather.read_table(path).schema for path in (full, empty)]
+    else:
+        from pyarrow import orc
+
+        schemas = [orc.read_table(path).schema for path in (full, empty)]
+
+    assert schemas[0] == schemas[1]
+    assert schemas[1].field("Codon").type == pa.string()
+    assert schemas[1].field("Count").type == pa.int64()
+
+
 def test_print_results_formatting(capsys):
     df = _sample_df()
     # Intentionally change order to ensure printing iterates rows